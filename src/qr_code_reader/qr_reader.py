@@ -1,9 +1,17 @@
 """QR Code reading functionality using OpenCV."""
 
+import asyncio
 import base64
+import importlib
 import logging
+import os
+import stat
+import struct
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import cv2
 import numpy as np
@@ -12,6 +20,155 @@ from PIL import Image
 logger = logging.getLogger(__name__)
 
 
+def _optional_import(name: str) -> Any:
+    """Import an optional dependency, returning None when it is unavailable."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+# ZBar bindings (optional "zbar" extra); also requires the system libzbar
+_pyzbar = _optional_import("pyzbar.pyzbar")
+
+# libjpeg-turbo bindings (optional "turbojpeg" extra); also requires the system
+# libturbojpeg
+_turbojpeg = _optional_import("turbojpeg")
+
+
+def _create_turbojpeg() -> Any:
+    """Create a TurboJPEG decoder, or None when libjpeg-turbo is unavailable."""
+    if _turbojpeg is None:
+        return None
+    try:
+        return _turbojpeg.TurboJPEG()
+    except (OSError, RuntimeError):
+        # PyTurboJPEG is installed but the shared library could not be loaded
+        return None
+
+
+# Decoding creates a fresh libjpeg-turbo handle per call, so one instance is
+# safe to share between threads
+_TURBOJPEG = _create_turbojpeg()
+
+# WeChat's QR detector only ships with opencv-contrib-python; it is created
+# without the CNN model files, so it uses its traditional detector and skips
+# super-resolution
+_wechat_class: Any = getattr(cv2, "wechat_qrcode_WeChatQRCode", None)
+
+# Image file extensions accepted from file paths
+_VALID_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".webp"})
+
+# Safety limits for images accepted for processing
+_MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+_MAX_IMAGE_DIMENSION = 10000
+_MAX_BASE64_LENGTH = (_MAX_FILE_SIZE + 2) // 3 * 4
+
+# Header markers used to read image dimensions without decoding pixels
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_JPEG_SIGNATURE = b"\xff\xd8\xff"
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# Longest data URL header ("data:image/png;base64,") searched for its comma
+_MAX_DATA_URL_HEADER = 256
+
+# Longest image side (in pixels) fed to the detector before downscaling
+_MAX_DETECTION_SIZE = 1024
+
+# Contrast equalization and adaptive threshold settings for hard images
+_CLAHE_CLIP_LIMIT = 20.0
+_CLAHE_TILE_GRID_SIZE = (8, 8)
+_ADAPTIVE_BLOCK_SIZE = 11
+_ADAPTIVE_C = 4
+
+# OpenCV detector and CLAHE objects keep internal scratch state, so each thread
+# gets its own instance, created once and reused across calls
+_thread_state = threading.local()
+
+_T = TypeVar("_T")
+
+
+def _thread_cached(name: str, factory: Callable[[], _T]) -> _T:
+    """Return the calling thread's cached instance, creating it on first use."""
+    instance: _T | None = getattr(_thread_state, name, None)
+    if instance is None:
+        instance = factory()
+        setattr(_thread_state, name, instance)
+    return instance
+
+
+def _get_detector() -> cv2.QRCodeDetector:
+    """Return the calling thread's QR code detector."""
+    return _thread_cached("detector", cv2.QRCodeDetector)
+
+
+def _get_wechat_detector() -> Any:
+    """Return the calling thread's WeChat QR code detector."""
+    return _thread_cached("wechat_detector", _wechat_class)
+
+
+def _get_clahe() -> cv2.CLAHE:
+    """Return the calling thread's CLAHE instance."""
+    return _thread_cached(
+        "clahe",
+        lambda: cv2.createCLAHE(
+            clipLimit=_CLAHE_CLIP_LIMIT, tileGridSize=_CLAHE_TILE_GRID_SIZE
+        ),
+    )
+
+
+# Shared pool for running the fallback decode passes in parallel; OpenCV
+# releases the GIL, so the passes use separate cores. It has at least one
+# thread per fallback pass, so a single image's passes never wait on each
+# other, and at least one per core, so the server's concurrent reads (one per
+# core) can keep every core busy
+_DECODE_WORKERS = max(4, os.cpu_count() or 1)
+_DECODE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_DECODE_WORKERS, thread_name_prefix="qr-decode"
+)
+
+# Number of distinct image shapes a thread keeps scratch buffers for
+_MAX_SCRATCH_SHAPES = 4
+
+# Largest buffer area (in pixels) kept between calls; full-resolution passes on
+# bigger images allocate fresh buffers so they are freed after each image
+_MAX_SCRATCH_PIXELS = _MAX_DETECTION_SIZE * _MAX_DETECTION_SIZE
+
+
+def _scratch_buffer(shape: tuple[int, int], name: str) -> np.ndarray[Any, Any]:
+    """
+    Return a reusable single-channel buffer owned by the calling thread.
+
+    OpenCV writes into the buffer in place when it is passed as ``dst=``, so
+    repeated images of the same size avoid reallocating intermediate arrays.
+    Buffers larger than the detection size are not cached.
+
+    Args:
+        shape: Height and width of the buffer
+        name: Name of the intermediate result stored in the buffer
+
+    Returns:
+        Uninitialized uint8 array of the requested shape
+    """
+    if shape[0] * shape[1] > _MAX_SCRATCH_PIXELS:
+        return np.empty(shape, dtype=np.uint8)
+
+    buffers_by_shape: dict[tuple[int, int], dict[str, np.ndarray[Any, Any]]]
+    buffers_by_shape = _thread_cached("scratch_buffers", dict)
+
+    buffers = buffers_by_shape.get(shape)
+    if buffers is None:
+        # Bound memory use when image sizes vary between requests
+        if len(buffers_by_shape) >= _MAX_SCRATCH_SHAPES:
+            buffers_by_shape.clear()
+        buffers = buffers_by_shape[shape] = {}
+
+    buffer = buffers.get(name)
+    if buffer is None:
+        buffer = buffers[name] = np.empty(shape, dtype=np.uint8)
+    return buffer
+
+
 class QRCodeError(Exception):
     """Base exception for QR code related errors."""
 
@@ -19,7 +176,12 @@ class QRCodeError(Exception):
 
 
 class QRCodeNotFoundError(QRCodeError):
-    """Raised when no QR code is found in the image."""
+    """
+    Raised when no QR code is found in the image.
+
+    read_qr_code returns None instead of raising this; it is kept for callers
+    that still catch it.
+    """
 
     pass
 
@@ -33,47 +195,57 @@ class InvalidImageError(QRCodeError):
 async def read_qr_code(
     image_path: str | None = None,
     image_data: str | None = None,
-) -> str:
+    image_bytes: bytes | memoryview | None = None,
+) -> str | None:
     """
     Read and decode QR code from an image.
 
     Args:
         image_path: Path to the image file
         image_data: Base64 encoded image data
+        image_bytes: Encoded image file contents, for in-process callers that
+            already hold the image in memory and can skip base64
 
     Returns:
-        Decoded QR code string
+        Decoded QR code string, or None when no QR code is found
 
     Raises:
-        QRCodeNotFoundError: When no QR code is found
         InvalidImageError: When image cannot be processed
-        ValueError: When neither image_path nor image_data is provided
+        ValueError: When no image input or more than one is provided
     """
-    if not image_path and not image_data:
-        raise ValueError("Either image_path or image_data must be provided")
+    provided = sum((bool(image_path), bool(image_data), image_bytes is not None))
+    if provided != 1:
+        raise ValueError(
+            "Exactly one of image_path, image_data or image_bytes must be provided"
+        )
 
     try:
+        # Image loading and decoding are CPU-bound, so run them in worker
+        # threads to keep the event loop free for other requests; OpenCV
+        # releases the GIL while it works
+
         # Load image
         if image_path:
-            image = _load_image_from_path(image_path)
+            image = await asyncio.to_thread(_load_image_from_path, image_path)
+        elif image_data:
+            image = await asyncio.to_thread(_load_image_from_base64, image_data)
         else:
-            assert image_data is not None  # Type checker hint
-            image = _load_image_from_base64(image_data)
+            assert image_bytes is not None  # Type checker hint
+            image = await asyncio.to_thread(_load_image_from_bytes, image_bytes)
 
         # Decode QR code
-        result = _decode_qr_code(image)
+        result = await asyncio.to_thread(_decode_qr_code, image)
 
+        # A missing QR code is an expected outcome, e.g. when scanning a stream
+        # of frames, so it is returned rather than raised
         if not result:
-            raise QRCodeNotFoundError("No QR code found in the image")
+            return None
 
-        logger.info(f"Successfully decoded QR code: {result[:50]}...")
+        logger.info("Successfully decoded QR code: %.50s...", result)
         return result
 
-    except QRCodeNotFoundError:
-        # Re-raise QR code not found errors as-is
-        raise
     except (cv2.error, Exception) as e:
-        logger.error(f"Error processing image: {e}")
+        logger.error("Error processing image: %s", e)
         raise InvalidImageError(f"Failed to process image: {str(e)}") from e
 
 
@@ -85,26 +257,35 @@ def _load_image_from_path(image_path: str) -> np.ndarray[Any, Any]:
         image_path: Path to the image file
 
     Returns:
-        OpenCV image array
+        Grayscale OpenCV image array
 
     Raises:
         InvalidImageError: When image cannot be loaded
     """
-    # Validate file path
-    path = Path(image_path)
-    if not path.exists():
-        raise InvalidImageError(f"Image file not found: {image_path}")
+    # Validate file path; a single stat covers existence, type and size
+    try:
+        file_stat = os.stat(image_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise InvalidImageError(f"Image file not found: {image_path}") from None
 
-    if not path.is_file():
+    if not stat.S_ISREG(file_stat.st_mode):
         raise InvalidImageError(f"Path is not a file: {image_path}")
 
     # Check file extension
-    valid_extensions = {".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".webp"}
-    if path.suffix.lower() not in valid_extensions:
-        raise InvalidImageError(f"Unsupported image format: {path.suffix}")
+    extension = os.path.splitext(image_path)[1]
+    if extension.lower() not in _VALID_EXTENSIONS:
+        raise InvalidImageError(f"Unsupported image format: {extension}")
+
+    # Check file size before reading it into memory
+    if file_stat.st_size > _MAX_FILE_SIZE:
+        raise InvalidImageError(f"Image file too large: {file_stat.st_size} bytes")
 
-    # Load image
-    image = cv2.imread(str(path))
+    # Read the file once; the header check and the decode share the buffer
+    with open(image_path, "rb") as image_file:
+        image_bytes = image_file.read()
+    _check_image_dimensions(image_bytes)
+
+    image = _decode_image_bytes(image_bytes)
     if image is None:
         raise InvalidImageError(f"Failed to load image: {image_path}")
 
@@ -119,84 +300,386 @@ def _load_image_from_base64(image_data: str) -> np.ndarray[Any, Any]:
         image_data: Base64 encoded image data
 
     Returns:
-        OpenCV image array
+        Grayscale OpenCV image array
 
     Raises:
         InvalidImageError: When image cannot be decoded
     """
     try:
-        # Remove data URL prefix if present
+        # Remove data URL prefix if present; only the header is searched for
+        # the separator, never the whole payload
+        start = 0
         if image_data.startswith("data:"):
-            image_data = image_data.split(",", 1)[1]
+            comma = image_data.find(",", 5, _MAX_DATA_URL_HEADER)
+            if comma < 0:
+                raise InvalidImageError("Malformed data URL")
+            start = comma + 1
 
-        # Decode base64
-        image_bytes = base64.b64decode(image_data)
+        # Reject oversized payloads before allocating the decoded buffer
+        if len(image_data) - start > _MAX_BASE64_LENGTH:
+            raise InvalidImageError("Base64 payload exceeds size limit")
 
-        # Convert to numpy array
-        nparr = np.frombuffer(image_bytes, np.uint8)
+        # b64decode encodes str input to ASCII anyway; doing it up front lets the
+        # data URL prefix be skipped with a memoryview instead of a string copy
+        encoded = memoryview(image_data.encode("ascii"))[start:]
 
-        # Decode image
-        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-        if image is None:
-            raise InvalidImageError("Failed to decode base64 image data")
+        # Decode base64
+        image_bytes = base64.b64decode(encoded)
 
-        return image
+        return _load_image_from_bytes(image_bytes)
 
     except Exception as e:
         raise InvalidImageError(f"Failed to process base64 image data: {str(e)}") from e
 
 
+def _load_image_from_bytes(image_bytes: bytes | memoryview) -> np.ndarray[Any, Any]:
+    """
+    Load image from encoded image file contents.
+
+    The buffer is wrapped without copying, so callers holding the image in
+    memory can pass it straight through.
+
+    Args:
+        image_bytes: Encoded image file contents
+
+    Returns:
+        Grayscale OpenCV image array
+
+    Raises:
+        InvalidImageError: When image cannot be decoded
+    """
+    if len(image_bytes) > _MAX_FILE_SIZE:
+        raise InvalidImageError(f"Image data too large: {len(image_bytes)} bytes")
+
+    _check_image_dimensions(image_bytes)
+
+    image = _decode_image_bytes(image_bytes)
+    if image is None:
+        raise InvalidImageError("Failed to decode image data")
+
+    return image
+
+
+def _decode_image_bytes(
+    image_bytes: bytes | memoryview,
+) -> np.ndarray[Any, Any] | None:
+    """
+    Decode encoded image contents to a grayscale image.
+
+    Decoding only needs luminance, so the color conversion is skipped. JPEG
+    data goes straight through libjpeg-turbo when it is installed.
+
+    Args:
+        image_bytes: Encoded image file contents
+
+    Returns:
+        Grayscale OpenCV image array or None if the data cannot be decoded
+    """
+    if _TURBOJPEG is not None and image_bytes[:3] == _JPEG_SIGNATURE:
+        try:
+            # Decode into a new array, not a per-thread scratch buffer: the
+            # image is handed to another thread for QR detection
+            image = _TURBOJPEG.decode(image_bytes, pixel_format=_turbojpeg.TJPF_GRAY)
+            return image[:, :, 0]  # type: ignore[no-any-return]
+        except OSError:
+            # Unsupported JPEG variant; let OpenCV try it
+            pass
+
+    return cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_GRAYSCALE)
+
+
+def _image_dimensions(image_bytes: bytes | memoryview) -> tuple[int, int] | None:
+    """
+    Read image dimensions from a PNG or JPEG header without decoding pixels.
+
+    Args:
+        image_bytes: Encoded image file contents
+
+    Returns:
+        Width and height, or None for other formats or unreadable headers
+    """
+    if image_bytes[:8] == _PNG_SIGNATURE and image_bytes[12:16] == b"IHDR":
+        if len(image_bytes) < 24:  # Truncated before the IHDR dimensions
+            return None
+        width, height = struct.unpack_from(">II", image_bytes, 16)
+        return width, height
+
+    if image_bytes[:2] == b"\xff\xd8":
+        # Walk the JPEG marker segments until a start-of-frame marker
+        offset = 2
+        while offset + 9 <= len(image_bytes):
+            if image_bytes[offset] != 0xFF:
+                return None
+            marker = image_bytes[offset + 1]
+            if marker == 0xFF:  # Fill byte
+                offset += 1
+            elif marker in _JPEG_SOF_MARKERS:
+                height, width = struct.unpack_from(">HH", image_bytes, offset + 5)
+                return width, height
+            elif 0xD0 <= marker <= 0xD8 or marker == 0x01:  # No payload
+                offset += 2
+            else:
+                (segment_length,) = struct.unpack_from(">H", image_bytes, offset + 2)
+                offset += 2 + segment_length
+
+    return None
+
+
+def _check_image_dimensions(image_bytes: bytes | memoryview) -> None:
+    """
+    Reject images whose header declares dimensions above the safety limit.
+
+    Args:
+        image_bytes: Encoded image file contents
+
+    Raises:
+        InvalidImageError: When the image dimensions are too large
+    """
+    dimensions = _image_dimensions(image_bytes)
+    if dimensions is None:
+        return
+
+    width, height = dimensions
+    if width > _MAX_IMAGE_DIMENSION or height > _MAX_IMAGE_DIMENSION:
+        raise InvalidImageError(f"Image dimensions too large: {width}x{height}")
+
+
 def _decode_qr_code(image: np.ndarray[Any, Any]) -> str | None:
     """
     Decode QR code from OpenCV image.
 
+    Large images are downscaled before detection and only retried at full
+    resolution when the downscaled pass finds nothing.
+
+    Args:
+        image: Grayscale or BGR OpenCV image array
+
+    Returns:
+        Decoded QR code string or None if not found
+    """
+    height, width = image.shape[:2]
+
+    if image.ndim == 2:
+        gray = image
+    else:
+        gray = cv2.cvtColor(
+            image,
+            cv2.COLOR_BGR2GRAY,
+            dst=_scratch_buffer((height, width), "gray"),
+        )
+
+    scale = max(height, width) / _MAX_DETECTION_SIZE
+    if scale > 1:
+        small_size = (max(1, round(width / scale)), max(1, round(height / scale)))
+        small = cv2.resize(
+            gray,
+            small_size,
+            dst=_scratch_buffer((small_size[1], small_size[0]), "small"),
+            interpolation=cv2.INTER_AREA,
+        )
+        result = _decode_gray(small)
+        if result:
+            return result
+
+    return _decode_gray(gray)
+
+
+def _decode_gray(gray: np.ndarray[Any, Any]) -> str | None:
+    """
+    Decode QR code from a grayscale image.
+
+    The WeChat and ZBar detectors are tried first when installed. Both do
+    their own binarization, so OpenCV only gets a single fallback pass in
+    that case; otherwise the full OpenCV preprocessing ladder runs.
+
+    Args:
+        gray: Single-channel OpenCV image array
+
+    Returns:
+        Decoded QR code string or None if not found
+    """
+    for backend in _FAST_BACKENDS:
+        result = backend(gray)
+        if result:
+            return result
+
+    if _FAST_BACKENDS:
+        return _decode_multi(_get_detector(), gray)
+
+    return _decode_opencv(gray)
+
+
+def _decode_wechat(gray: np.ndarray[Any, Any]) -> str | None:
+    """
+    Decode QR code with OpenCV's WeChat detector.
+
+    Args:
+        gray: Single-channel OpenCV image array
+
+    Returns:
+        Decoded QR code string or None if not found
+    """
+    decoded_info, _ = _get_wechat_detector().detectAndDecode(gray)
+
+    for info in decoded_info:
+        if info:
+            return str(info)
+
+    return None
+
+
+def _decode_zbar(gray: np.ndarray[Any, Any]) -> str | None:
+    """
+    Decode QR code with ZBar.
+
+    Args:
+        gray: Single-channel OpenCV image array
+
+    Returns:
+        Decoded QR code string or None if not found
+    """
+    for symbol in _pyzbar.decode(gray, symbols=[_pyzbar.ZBarSymbol.QRCODE]):
+        if symbol.data:
+            return str(symbol.data.decode("utf-8", errors="replace"))
+
+    return None
+
+
+def _decode_opencv(gray: np.ndarray[Any, Any]) -> str | None:
+    """
+    Decode QR code with OpenCV's QRCodeDetector and preprocessing fallbacks.
+
+    The multi-code pass runs first. When it fails, the single-code pass on
+    the grayscale image and the preprocessed variants are decoded in
+    parallel, and the first successful result wins.
+
+    Passes that are still running when a result is found cannot be stopped.
+    They may go on reading scratch buffers that this thread reuses for its
+    next image, so their results are ignored.
+
+    Args:
+        gray: Single-channel OpenCV image array
+
+    Returns:
+        Decoded QR code string or None if not found
+    """
+    # Try to decode QR code(s)
+    result = _decode_multi(_get_detector(), gray)
+    if result:
+        return result
+
+    # Preprocessing writes into per-thread scratch buffers for this shape
+    shape = (gray.shape[0], gray.shape[1])
+
+    # Gaussian blur to reduce noise
+    blurred = cv2.GaussianBlur(gray, (5, 5), 0, dst=_scratch_buffer(shape, "blurred"))
+
+    # Global Otsu threshold
+    _, thresh = cv2.threshold(
+        gray,
+        0,
+        255,
+        cv2.THRESH_BINARY + cv2.THRESH_OTSU,
+        dst=_scratch_buffer(shape, "thresh"),
+    )
+
+    # Contrast equalization and adaptive thresholding, for uneven lighting and
+    # low contrast where a global threshold loses the code
+    equalized = _get_clahe().apply(gray, dst=_scratch_buffer(shape, "equalized"))
+    equalized = cv2.GaussianBlur(
+        equalized, (5, 5), 0, dst=_scratch_buffer(shape, "equalized_blurred")
+    )
+    adaptive = cv2.adaptiveThreshold(
+        equalized,
+        255,
+        cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+        cv2.THRESH_BINARY,
+        _ADAPTIVE_BLOCK_SIZE,
+        _ADAPTIVE_C,
+        dst=_scratch_buffer(shape, "adaptive"),
+    )
+
+    futures = [
+        _DECODE_EXECUTOR.submit(_decode_candidate, candidate)
+        for candidate in (gray, blurred, thresh, adaptive)
+    ]
+    try:
+        for future in as_completed(futures):
+            result = future.result()
+            if result:
+                return result
+    finally:
+        # Passes that already started run to completion; their result is dropped
+        for future in futures:
+            future.cancel()
+
+    return None
+
+
+def _decode_candidate(image: np.ndarray[Any, Any]) -> str | None:
+    """
+    Run a single detect-and-decode pass with the current thread's detector.
+
     Args:
         image: OpenCV image array
 
     Returns:
         Decoded QR code string or None if not found
     """
-    # Initialize QR code detector
-    detector = cv2.QRCodeDetector()
+    return _try_decode(_get_detector(), image)
+
+
+def _decode_multi(
+    detector: cv2.QRCodeDetector, image: np.ndarray[Any, Any]
+) -> str | None:
+    """
+    Run a multi-code detect-and-decode pass.
+
+    Args:
+        detector: QR code detector to use
+        image: OpenCV image array
 
-    # Try to decode QR code
+    Returns:
+        First non-empty decoded QR code string or None if not found
+    """
     retval, decoded_info, _, _ = detector.detectAndDecodeMulti(image)
 
     if retval and decoded_info:
         # Return the first valid decoded result
         for info in decoded_info:
             if info:  # Skip empty strings
-                return info
+                return str(info)
 
-    # If multi-decode fails, try single decode
-    retval, decoded_info, _ = detector.detectAndDecode(image)  # type: ignore
+    return None
 
-    if retval and decoded_info:
-        return str(decoded_info)
 
-    # Try with grayscale conversion
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    retval, decoded_info, _ = detector.detectAndDecode(gray)  # type: ignore
+def _try_decode(
+    detector: cv2.QRCodeDetector, image: np.ndarray[Any, Any]
+) -> str | None:
+    """
+    Run a single detect-and-decode pass.
 
-    if retval and decoded_info:
-        return str(decoded_info)
+    Args:
+        detector: QR code detector to use
+        image: OpenCV image array
 
-    # Try with different preprocessing
-    # Gaussian blur to reduce noise
-    blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-    retval, decoded_info, _ = detector.detectAndDecode(blurred)  # type: ignore
+    Returns:
+        Decoded QR code string or None if not found
+    """
+    decoded_info, _, _ = detector.detectAndDecode(image)
 
-    if retval and decoded_info:
+    if decoded_info:
         return str(decoded_info)
 
-    # Try with thresholding
-    _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-    retval, decoded_info, _ = detector.detectAndDecode(thresh)  # type: ignore
+    return None
 
-    if retval and decoded_info:
-        return str(decoded_info)
 
-    return None
+# Optional detectors, fastest and most robust first
+_FAST_BACKENDS: list[Callable[[np.ndarray[Any, Any]], str | None]] = []
+if _wechat_class is not None:
+    _FAST_BACKENDS.append(_decode_wechat)
+if _pyzbar is not None:
+    _FAST_BACKENDS.append(_decode_zbar)
 
 
 def validate_image_safety(image_path: str) -> bool:
@@ -212,20 +695,24 @@ def validate_image_safety(image_path: str) -> bool:
     try:
         path = Path(image_path)
 
-        # Check file size (limit to 50MB)
-        if path.stat().st_size > 50 * 1024 * 1024:
-            logger.warning(f"Image file too large: {path.stat().st_size} bytes")
+        # Check file size
+        file_size = path.stat().st_size
+        if file_size > _MAX_FILE_SIZE:
+            logger.warning("Image file too large: %d bytes", file_size)
             return False
 
-        # Try to open with PIL for additional validation
+        # Try to open with PIL for additional validation; this only parses the
+        # header, pixel data is never decoded here
         with Image.open(path) as img:
-            # Check image dimensions (limit to 10000x10000)
-            if img.width > 10000 or img.height > 10000:
-                logger.warning(f"Image dimensions too large: {img.width}x{img.height}")
-                return False
+            width, height = img.size
+
+        # Check image dimensions
+        if width > _MAX_IMAGE_DIMENSION or height > _MAX_IMAGE_DIMENSION:
+            logger.warning("Image dimensions too large: %dx%d", width, height)
+            return False
 
         return True
 
     except Exception as e:
-        logger.error(f"Image validation failed: {e}")
+        logger.error("Image validation failed: %s", e)
         return False
@@ -1,7 +1,10 @@
 """MCP Server for QR Code Reader."""
 
 import asyncio
+import functools
 import logging
+import os
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import mcp.server.stdio
@@ -18,6 +21,18 @@ logger = logging.getLogger(__name__)
 # Create server instance
 server = Server("qr-code-reader")
 
+# Number of worker tasks processing QR code reads while the server runs
+_WORKER_COUNT = os.cpu_count() or 1
+
+# Pending reads queued per worker before callers wait for a free slot
+_QUEUE_SIZE_PER_WORKER = 4
+
+_ReadJob = tuple[Callable[[], Awaitable[str | None]], asyncio.Future[str | None]]
+
+# Queue of pending QR code reads, drained by the workers started in main();
+# None when no workers are running, in which case reads happen inline
+_read_queue: asyncio.Queue[_ReadJob] | None = None
+
 
 @server.list_tools()  # type: ignore[misc,no-untyped-call]
 async def handle_list_tools() -> list[types.Tool]:
@@ -61,17 +76,29 @@ async def handle_call_tool(
             image_path = arguments.get("image_path")
             image_data = arguments.get("image_data")
 
-            # Validate input
-            if not image_path and not image_data:
+            # Validate input; exactly one image source is accepted
+            if bool(image_path) == bool(image_data):
                 return [
                     types.TextContent(
                         type="text",
-                        text="Error: Either image_path or image_data must be provided",
+                        text="Error: Provide exactly one of image_path or image_data",
                     )
                 ]
 
             # Read QR code
-            result = await read_qr_code(image_path=image_path, image_data=image_data)
+            result = await _submit_read(
+                functools.partial(
+                    read_qr_code, image_path=image_path, image_data=image_data
+                )
+            )
+
+            if result is None:
+                return [
+                    types.TextContent(
+                        type="text",
+                        text="Error reading QR code: No QR code found in the image",
+                    )
+                ]
 
             return [
                 types.TextContent(
@@ -88,7 +115,7 @@ async def handle_call_tool(
                 )
             ]
         except Exception as e:
-            logger.error(f"Error reading QR code: {e}")
+            logger.error("Error reading QR code: %s", e)
             return [
                 types.TextContent(
                     type="text",
@@ -99,9 +126,42 @@ async def handle_call_tool(
         raise ValueError(f"Unknown tool: {name}")
 
 
+async def _submit_read(read: Callable[[], Awaitable[str | None]]) -> str | None:
+    """Run a QR code read through the worker queue, or inline without workers."""
+    if _read_queue is None:
+        return await read()
+
+    future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+    await _read_queue.put((read, future))
+    return await future
+
+
+async def _read_worker(queue: asyncio.Queue[_ReadJob]) -> None:
+    """Process queued QR code reads until cancelled."""
+    while True:
+        read, future = await queue.get()
+        try:
+            if future.done():
+                # The caller went away while the read was queued
+                continue
+            try:
+                result = await read()
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            queue.task_done()
+
+
 async def main() -> None:
     """Main entry point for the QR Code Reader MCP server."""
-    logger.info(f"QR Code Reader MCP Server v{__version__} starting...")
+    logger.info("QR Code Reader MCP Server v%s starting...", __version__)
 
     # Server options
     options = InitializationOptions(
@@ -113,12 +173,28 @@ async def main() -> None:
         ),
     )
 
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            options,
-        )
+    # Start the workers that process QR code reads; a fixed number of workers
+    # bounds how many images are decoded at once. Queued and waiting calls
+    # still hold their arguments, so this does not bound memory use
+    global _read_queue
+    queue: asyncio.Queue[_ReadJob] = asyncio.Queue(
+        maxsize=_WORKER_COUNT * _QUEUE_SIZE_PER_WORKER
+    )
+    workers = [asyncio.create_task(_read_worker(queue)) for _ in range(_WORKER_COUNT)]
+    _read_queue = queue
+
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                options,
+            )
+    finally:
+        _read_queue = None
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,55 @@
+"""Shared fixtures for the test suite."""
+
+import copy
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from qr_code_reader import qr_reader, server
+from qr_code_reader.qr_reader import read_qr_code
+from qr_code_reader.server import handle_list_tools
+
+# Spec'd once per session; each test patches in a reset copy
+_read_qr_code_mock = AsyncMock(spec=read_qr_code)
+
+
+@pytest.fixture(scope="session")
+async def tool_list():
+    """List the server's MCP tools once per test session."""
+    return await handle_list_tools()
+
+
+@pytest.fixture(scope="session")
+def tool_schema(tool_list):
+    """Input schema of the qr_code_read tool, shared by schema-shape tests."""
+    return tool_list[0].inputSchema
+
+
+@pytest.fixture
+def mock_read_qr(monkeypatch):
+    """Patch read_qr_code with a fresh copy of the prebuilt spec'd mock."""
+    mock = copy.copy(_read_qr_code_mock)
+    mock.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(qr_reader, "read_qr_code", mock)
+    return mock
+
+
+@pytest.fixture
+def opencv_only(monkeypatch):
+    """Disable the optional WeChat and ZBar backends so OpenCV decodes alone."""
+    monkeypatch.setattr(qr_reader, "_FAST_BACKENDS", [])
+
+
+@pytest.fixture(scope="session")
+def server_logger():
+    """Mock logger shared by every test that checks server logging."""
+    return MagicMock(spec=logging.Logger)
+
+
+@pytest.fixture
+def logger_mock(server_logger, monkeypatch):
+    """Install the shared mock logger in the server module for one test."""
+    server_logger.reset_mock()
+    monkeypatch.setattr(server, "logger", server_logger)
+    return server_logger
@@ -52,7 +52,6 @@ class TestMCPIntegration:
 
         return base64.b64encode(img_data).decode("utf-8")
 
-    @pytest.mark.asyncio
     async def test_server_startup_and_shutdown(self):
         """Test that MCP server can start up and shut down gracefully."""
         # Mock the stdio streams
@@ -79,7 +78,6 @@ class TestMCPIntegration:
         mock_stdio.__aenter__.assert_called_once()
         mock_stdio.__aexit__.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_mcp_tool_registration(self):
         """Verify that MCP tools are properly registered and discoverable."""
         tools = await handle_list_tools()
@@ -106,7 +104,6 @@ class TestMCPIntegration:
         assert {"required": ["image_path"]} in required_schemas
         assert {"required": ["image_data"]} in required_schemas
 
-    @pytest.mark.asyncio
     async def test_end_to_end_image_processing_workflow_file_path(
         self, sample_qr_image_path
     ):
@@ -125,7 +122,6 @@ class TestMCPIntegration:
         assert "QR Code decoded successfully:" in result[0].text
         assert "https://example.com/test" in result[0].text
 
-    @pytest.mark.asyncio
     async def test_end_to_end_image_processing_workflow_base64(
         self, sample_qr_image_base64
     ):
@@ -144,7 +140,6 @@ class TestMCPIntegration:
         assert "QR Code decoded successfully:" in result[0].text
         assert "test data for base64" in result[0].text
 
-    @pytest.mark.asyncio
     async def test_response_format_validation_success(self, sample_qr_image_path):
         """Validate that successful responses follow the expected format."""
         result = await handle_call_tool(
@@ -163,7 +158,6 @@ class TestMCPIntegration:
         assert isinstance(content.text, str)
         assert content.text.startswith("QR Code decoded successfully:")
 
-    @pytest.mark.asyncio
     async def test_response_format_validation_error(self):
         """Validate that error responses follow the expected format."""
         # Test with no arguments to trigger validation error
@@ -181,7 +175,6 @@ class TestMCPIntegration:
         assert isinstance(content.text, str)
         assert content.text.startswith("Error:")
 
-    @pytest.mark.asyncio
     async def test_error_handling_invalid_image_path(self):
         """Test error handling for invalid image paths."""
         result = await handle_call_tool(
@@ -192,7 +185,6 @@ class TestMCPIntegration:
         assert isinstance(result[0], types.TextContent)
         assert "Error reading QR code:" in result[0].text
 
-    @pytest.mark.asyncio
     async def test_error_handling_invalid_base64(self):
         """Test error handling for invalid base64 data."""
         result = await handle_call_tool(
@@ -203,7 +195,6 @@ class TestMCPIntegration:
         assert isinstance(result[0], types.TextContent)
         assert "Error reading QR code:" in result[0].text
 
-    @pytest.mark.asyncio
     async def test_error_handling_no_qr_code_in_image(self):
         """Test error handling when image contains no QR code."""
         # Create an image without QR code
@@ -221,7 +212,6 @@ class TestMCPIntegration:
         assert isinstance(result[0], types.TextContent)
         assert "Error reading QR code:" in result[0].text
 
-    @pytest.mark.asyncio
     async def test_error_handling_missing_arguments(self):
         """Test error handling when required arguments are missing."""
         result = await handle_call_tool("qr_code_read", {})
@@ -229,16 +219,14 @@ class TestMCPIntegration:
         assert len(result) == 1
         assert isinstance(result[0], types.TextContent)
         assert (
-            "Error: Either image_path or image_data must be provided" in result[0].text
+            "Error: Provide exactly one of image_path or image_data" in result[0].text
         )
 
-    @pytest.mark.asyncio
     async def test_error_handling_unknown_tool(self):
         """Test error handling for unknown tool calls."""
         with pytest.raises(ValueError, match="Unknown tool: nonexistent_tool"):
             await handle_call_tool("nonexistent_tool", {})
 
-    @pytest.mark.asyncio
     async def test_logging_configuration(self):
         """Test that logging is properly configured."""
         logger = logging.getLogger("qr_code_reader.server")
@@ -247,7 +235,6 @@ class TestMCPIntegration:
         assert logger is not None
         assert logger.level <= logging.INFO
 
-    @pytest.mark.asyncio
     async def test_concurrent_requests(self, sample_qr_image_path):
         """Test that server can handle multiple concurrent requests."""
         # Create multiple concurrent requests
@@ -269,7 +256,6 @@ class TestMCPIntegration:
             assert "QR Code decoded successfully:" in result[0].text
             assert "https://example.com/test" in result[0].text
 
-    @pytest.mark.asyncio
     async def test_server_capabilities(self):
         """Test that server capabilities are properly configured."""
         capabilities = server.get_capabilities(
@@ -282,7 +268,6 @@ class TestMCPIntegration:
         # MCP server should support tools capability
         assert capabilities.tools is not None
 
-    @pytest.mark.asyncio
     async def test_server_version_and_metadata(self):
         """Test that server metadata is properly configured."""
         from qr_code_reader import __version__
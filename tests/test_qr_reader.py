@@ -1,7 +1,13 @@
 """Tests for QR code reader functionality."""
 
+import base64
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import cv2
 import numpy as np
 import pytest
 
@@ -10,6 +16,14 @@ from qr_code_reader.qr_reader import (
     QRCodeError,
     QRCodeNotFoundError,
     _decode_qr_code,
+    _decode_zbar,
+    _get_clahe,
+    _get_detector,
+    _image_dimensions,
+    _load_image_from_base64,
+    _load_image_from_bytes,
+    _load_image_from_path,
+    _scratch_buffer,
     read_qr_code,
     validate_image_safety,
 )
@@ -18,15 +32,30 @@ from qr_code_reader.qr_reader import (
 class TestQRCodeReader:
     """Test suite for QR code reader."""
 
-    @pytest.mark.asyncio
     async def test_read_qr_code_no_input(self):
         """Test that ValueError is raised when no input is provided."""
         with pytest.raises(
-            ValueError, match="Either image_path or image_data must be provided"
+            ValueError,
+            match="Exactly one of image_path, image_data or image_bytes",
         ):
             await read_qr_code()
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "inputs",
+        [
+            {"image_path": "/fake/path.png", "image_data": "base64_data"},
+            {"image_path": "/fake/path.png", "image_bytes": b"image"},
+            {"image_data": "base64_data", "image_bytes": b"image"},
+        ],
+    )
+    async def test_read_qr_code_multiple_inputs(self, inputs):
+        """Test that ValueError is raised when more than one input is provided."""
+        with pytest.raises(
+            ValueError,
+            match="Exactly one of image_path, image_data or image_bytes",
+        ):
+            await read_qr_code(**inputs)
+
     @patch("qr_code_reader.qr_reader._load_image_from_path")
     @patch("qr_code_reader.qr_reader._decode_qr_code")
     async def test_read_qr_code_from_path_success(self, mock_decode, mock_load):
@@ -41,7 +70,6 @@ class TestQRCodeReader:
         mock_load.assert_called_once_with("/fake/path.jpg")
         mock_decode.assert_called_once_with(mock_image)
 
-    @pytest.mark.asyncio
     @patch("qr_code_reader.qr_reader._load_image_from_base64")
     @patch("qr_code_reader.qr_reader._decode_qr_code")
     async def test_read_qr_code_from_base64_success(self, mock_decode, mock_load):
@@ -57,19 +85,53 @@ class TestQRCodeReader:
         assert result == "test_data"
         mock_decode.assert_called_once_with(mock_image)
 
-    @pytest.mark.asyncio
+    @patch("qr_code_reader.qr_reader._decode_qr_code")
+    async def test_read_qr_code_from_bytes_success(self, mock_decode):
+        """Test successful QR code reading from an in-memory buffer."""
+        _, png = cv2.imencode(".png", np.zeros((20, 30), dtype=np.uint8))
+        mock_decode.return_value = "test_data"
+
+        result = await read_qr_code(image_bytes=memoryview(png.tobytes()))
+
+        assert result == "test_data"
+        (image,) = mock_decode.call_args[0]
+        assert image.shape == (20, 30)
+
+    @patch("qr_code_reader.qr_reader._load_image_from_path")
+    @patch("qr_code_reader.qr_reader._decode_qr_code")
+    async def test_read_qr_code_runs_off_event_loop(self, mock_decode, mock_load):
+        """Test that image loading and decoding run in worker threads."""
+        threads = []
+
+        def load(image_path):
+            threads.append(threading.get_ident())
+            return np.zeros((100, 100), dtype=np.uint8)
+
+        def decode(image):
+            threads.append(threading.get_ident())
+            return "test_data"
+
+        mock_load.side_effect = load
+        mock_decode.side_effect = decode
+
+        result = await read_qr_code(image_path="/fake/path.jpg")
+
+        assert result == "test_data"
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
     @patch("qr_code_reader.qr_reader._load_image_from_path")
     @patch("qr_code_reader.qr_reader._decode_qr_code")
     async def test_read_qr_code_not_found(self, mock_decode, mock_load):
-        """Test QRCodeNotFoundError when no QR code is found."""
+        """Test that None is returned when no QR code is found."""
         mock_image = np.zeros((100, 100, 3), dtype=np.uint8)
         mock_load.return_value = mock_image
         mock_decode.return_value = None
 
-        with pytest.raises(QRCodeNotFoundError, match="No QR code found in the image"):
-            await read_qr_code(image_path="/fake/path.jpg")
+        result = await read_qr_code(image_path="/fake/path.jpg")
+
+        assert result is None
 
-    @pytest.mark.asyncio
     @patch("qr_code_reader.qr_reader._load_image_from_path")
     async def test_read_qr_code_invalid_image(self, mock_load):
         """Test InvalidImageError when image processing fails."""
@@ -78,15 +140,164 @@ class TestQRCodeReader:
         with pytest.raises(InvalidImageError, match="Failed to process image"):
             await read_qr_code(image_path="/fake/path.jpg")
 
+    def test_load_image_from_path_not_found(self, tmp_path):
+        """Test that a missing image file is reported as not found."""
+        with pytest.raises(InvalidImageError, match="Image file not found"):
+            _load_image_from_path(str(tmp_path / "missing.png"))
+
+    def test_load_image_from_path_not_a_file(self, tmp_path):
+        """Test that a directory path is rejected."""
+        directory = tmp_path / "image.png"
+        directory.mkdir()
+
+        with pytest.raises(InvalidImageError, match="Path is not a file"):
+            _load_image_from_path(str(directory))
+
+    def test_load_image_from_path_extension_case_insensitive(self, tmp_path):
+        """Test that upper-case image extensions are accepted."""
+        _, png = cv2.imencode(".png", np.zeros((20, 30), dtype=np.uint8))
+        image_path = tmp_path / "image.PNG"
+        image_path.write_bytes(png.tobytes())
+
+        image = _load_image_from_path(str(image_path))
+        assert image.shape == (20, 30)
+
+    def test_load_image_from_path_unsupported_format(self, tmp_path):
+        """Test that unsupported file extensions are rejected."""
+        image_path = tmp_path / "image.gif"
+        image_path.write_bytes(b"GIF89a")
+
+        with pytest.raises(InvalidImageError, match="Unsupported image format: .gif"):
+            _load_image_from_path(str(image_path))
+
+    def test_load_image_from_path_dimensions_too_large(self, tmp_path):
+        """Test that oversized images are rejected from the header alone."""
+        image_path = tmp_path / "image.png"
+        image_path.write_bytes(
+            b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+            + struct.pack(">II", 20000, 100)
+            + b"\x08\x00\x00\x00\x00"
+        )
+
+        with pytest.raises(InvalidImageError, match="dimensions too large"):
+            _load_image_from_path(str(image_path))
+
+    def test_load_image_from_path_file_too_large(self, tmp_path):
+        """Test that files above the size limit are rejected before reading."""
+        _, png = cv2.imencode(".png", np.zeros((20, 30), dtype=np.uint8))
+        image_path = tmp_path / "image.png"
+        image_path.write_bytes(png.tobytes())
+
+        with (
+            patch("qr_code_reader.qr_reader._MAX_FILE_SIZE", 10),
+            pytest.raises(InvalidImageError, match="Image file too large"),
+        ):
+            _load_image_from_path(str(image_path))
+
+    @pytest.mark.parametrize("extension", [".png", ".jpg"])
+    def test_image_dimensions_from_header(self, extension):
+        """Test reading PNG and JPEG dimensions without decoding pixels."""
+        _, encoded = cv2.imencode(extension, np.zeros((20, 30), dtype=np.uint8))
+
+        assert _image_dimensions(encoded.tobytes()) == (30, 20)
+
+    def test_image_dimensions_unknown_format(self):
+        """Test that formats without header parsing report no dimensions."""
+        _, bmp = cv2.imencode(".bmp", np.zeros((20, 30), dtype=np.uint8))
+
+        assert _image_dimensions(bmp.tobytes()) is None
+
+    def test_load_image_from_base64_data_url(self):
+        """Test loading base64 image data with and without a data URL prefix."""
+        _, png = cv2.imencode(".png", np.zeros((20, 30, 3), dtype=np.uint8))
+        encoded = base64.b64encode(png.tobytes()).decode("ascii")
+
+        image = _load_image_from_base64(encoded)
+        assert image.shape == (20, 30)
+
+        image = _load_image_from_base64(f"data:image/png;base64,{encoded}")
+        assert image.shape == (20, 30)
+
+    def test_load_image_from_base64_invalid(self):
+        """Test that undecodable base64 image data raises InvalidImageError."""
+        with pytest.raises(InvalidImageError, match="Failed to process base64"):
+            _load_image_from_base64("data:image/png;base64,bm90IGFuIGltYWdl")
+
+    def test_load_image_from_base64_malformed_data_url(self):
+        """Test that a data URL without a header separator is rejected."""
+        with pytest.raises(InvalidImageError, match="Malformed data URL"):
+            _load_image_from_base64("data:image/png;base64" + "A" * 1000)
+
+    def test_load_image_from_base64_payload_too_large(self):
+        """Test that oversized base64 payloads are rejected before decoding."""
+        with (
+            patch("qr_code_reader.qr_reader._MAX_BASE64_LENGTH", 8),
+            patch("base64.b64decode") as mock_b64decode,
+            pytest.raises(InvalidImageError, match="exceeds size limit"),
+        ):
+            _load_image_from_base64("data:image/png;base64,QUFBQUFBQUFBQUFB")
+
+        mock_b64decode.assert_not_called()
+
+    def test_load_image_from_bytes_invalid(self):
+        """Test that undecodable image bytes raise InvalidImageError."""
+        with pytest.raises(InvalidImageError, match="Failed to decode image data"):
+            _load_image_from_bytes(memoryview(b"not an image"))
+
+    def test_load_image_from_bytes_truncated_png_header(self):
+        """Test that a PNG cut off inside its IHDR chunk raises InvalidImageError."""
+        _, png = cv2.imencode(".png", np.zeros((20, 30), dtype=np.uint8))
+
+        assert _image_dimensions(png.tobytes()[:20]) is None
+        with pytest.raises(InvalidImageError, match="Failed to decode image data"):
+            _load_image_from_bytes(png.tobytes()[:20])
+
+    def test_load_image_from_bytes_jpeg_uses_turbojpeg(self):
+        """Test that JPEG data is decoded by libjpeg-turbo when installed."""
+        _, jpeg = cv2.imencode(".jpg", np.zeros((20, 30), dtype=np.uint8))
+
+        with (
+            patch("qr_code_reader.qr_reader._TURBOJPEG") as mock_turbojpeg,
+            patch("qr_code_reader.qr_reader._turbojpeg") as mock_module,
+        ):
+            mock_turbojpeg.decode.return_value = np.ones((20, 30, 1), np.uint8)
+
+            image = _load_image_from_bytes(jpeg.tobytes())
+
+        assert image.shape == (20, 30)
+        assert image.all()
+        mock_turbojpeg.decode.assert_called_once_with(
+            jpeg.tobytes(), pixel_format=mock_module.TJPF_GRAY
+        )
+
+    def test_load_image_from_bytes_turbojpeg_fallback(self):
+        """Test that JPEG data libjpeg-turbo rejects falls back to OpenCV."""
+        _, jpeg = cv2.imencode(".jpg", np.zeros((20, 30), dtype=np.uint8))
+        _, png = cv2.imencode(".png", np.zeros((20, 30), dtype=np.uint8))
+
+        with (
+            patch("qr_code_reader.qr_reader._TURBOJPEG") as mock_turbojpeg,
+            patch("qr_code_reader.qr_reader._turbojpeg"),
+        ):
+            mock_turbojpeg.decode.side_effect = OSError("Unsupported JPEG")
+
+            assert _load_image_from_bytes(jpeg.tobytes()).shape == (20, 30)
+            assert _load_image_from_bytes(png.tobytes()).shape == (20, 30)
+
+        # Only the JPEG data is handed to libjpeg-turbo
+        mock_turbojpeg.decode.assert_called_once()
+
+    @pytest.mark.usefixtures("opencv_only")
     def test_decode_qr_code_success(self):
         """Test successful QR code decoding."""
         # Create a mock image
         mock_image = np.zeros((100, 100, 3), dtype=np.uint8)
 
-        with patch("cv2.QRCodeDetector") as mock_detector_class:
-            mock_detector = Mock()
-            mock_detector_class.return_value = mock_detector
-
+        with (
+            patch("qr_code_reader.qr_reader._get_detector") as mock_get_detector,
+            patch("cv2.GaussianBlur") as mock_blur,
+        ):
+            mock_detector = mock_get_detector.return_value
             # Mock successful detection
             mock_detector.detectAndDecodeMulti.return_value = (
                 True,
@@ -98,45 +309,299 @@ class TestQRCodeReader:
             result = _decode_qr_code(mock_image)
             assert result == "https://example.com"
 
+            # Preprocessing fallbacks are skipped once a code is found
+            mock_detector.detectAndDecode.assert_not_called()
+            mock_blur.assert_not_called()
+
+    @pytest.mark.usefixtures("opencv_only")
     def test_decode_qr_code_fallback_to_single(self):
         """Test fallback to single decode when multi-decode fails."""
         mock_image = np.zeros((100, 100, 3), dtype=np.uint8)
+        multi_images = []
 
-        with patch("cv2.QRCodeDetector") as mock_detector_class:
-            mock_detector = Mock()
-            mock_detector_class.return_value = mock_detector
+        def detect_multi(image):
+            multi_images.append(image)
+            return False, [], None, None
 
+        def detect(image):
+            # Only the unprocessed grayscale image decodes
+            if image is multi_images[0]:
+                return "test_data", None, None
+            return "", None, None
+
+        with patch("qr_code_reader.qr_reader._get_detector") as mock_get_detector:
+            mock_detector = mock_get_detector.return_value
             # Mock multi-decode failure and single-decode success
-            mock_detector.detectAndDecodeMulti.return_value = (False, [], None, None)
-            mock_detector.detectAndDecode.return_value = (True, "test_data", None)
+            mock_detector.detectAndDecodeMulti.side_effect = detect_multi
+            mock_detector.detectAndDecode.side_effect = detect
 
             result = _decode_qr_code(mock_image)
             assert result == "test_data"
 
+            # Detection runs on the grayscale image only
+            (gray,) = multi_images
+            assert gray.ndim == 2
+
+    @pytest.mark.usefixtures("opencv_only")
+    def test_decode_qr_code_grayscale_input(self):
+        """Test that grayscale input is decoded without color conversion."""
+        gray_image = np.zeros((100, 100), dtype=np.uint8)
+
+        with (
+            patch("qr_code_reader.qr_reader._get_detector") as mock_get_detector,
+            patch("cv2.cvtColor") as mock_cvt,
+        ):
+            mock_detector = mock_get_detector.return_value
+            mock_detector.detectAndDecodeMulti.return_value = (
+                True,
+                ["https://example.com"],
+                None,
+                None,
+            )
+
+            result = _decode_qr_code(gray_image)
+            assert result == "https://example.com"
+
+            mock_cvt.assert_not_called()
+            (gray,) = mock_detector.detectAndDecodeMulti.call_args[0]
+            assert gray is gray_image
+
+    @pytest.mark.usefixtures("opencv_only")
+    def test_decode_qr_code_downscales_large_image(self):
+        """Test that large images are decoded at reduced resolution first."""
+        mock_image = np.zeros((1500, 3000, 3), dtype=np.uint8)
+
+        with patch("qr_code_reader.qr_reader._get_detector") as mock_get_detector:
+            mock_detector = mock_get_detector.return_value
+            mock_detector.detectAndDecodeMulti.return_value = (
+                True,
+                ["https://example.com"],
+                None,
+                None,
+            )
+
+            result = _decode_qr_code(mock_image)
+            assert result == "https://example.com"
+
+            (gray,) = mock_detector.detectAndDecodeMulti.call_args[0]
+            assert gray.shape == (512, 1024)
+
+    @pytest.mark.usefixtures("opencv_only")
+    @pytest.mark.parametrize("shape", [(2, 3000), (3000, 2), (1, 1025)])
+    def test_decode_qr_code_extreme_aspect_ratio(self, shape):
+        """Test that very thin images keep at least one pixel when downscaled."""
+        image = np.zeros(shape, dtype=np.uint8)
+
+        assert _decode_qr_code(image) is None
+
+    @pytest.mark.usefixtures("opencv_only")
+    def test_decode_qr_code_large_image_full_resolution_retry(self):
+        """Test that a failed downscaled pass is retried at full resolution."""
+        mock_image = np.zeros((1500, 3000, 3), dtype=np.uint8)
+
+        def detect_multi(image):
+            if image.shape == (1500, 3000):
+                return True, ["full_res_data"], None, None
+            return False, [], None, None
+
+        with patch("qr_code_reader.qr_reader._get_detector") as mock_get_detector:
+            mock_detector = mock_get_detector.return_value
+            mock_detector.detectAndDecodeMulti.side_effect = detect_multi
+            mock_detector.detectAndDecode.return_value = ("", None, None)
+
+            result = _decode_qr_code(mock_image)
+            assert result == "full_res_data"
+
+    @pytest.mark.usefixtures("opencv_only")
+    def test_decode_qr_code_fallback_to_otsu_threshold(self):
+        """Test fallback to the globally thresholded image."""
+        mock_image = np.zeros((100, 100, 3), dtype=np.uint8)
+
+        with (
+            patch("qr_code_reader.qr_reader._get_detector") as mock_get_detector,
+            patch("cv2.threshold") as mock_thresh,
+        ):
+            mock_detector = mock_get_detector.return_value
+            thresh_image = np.full((100, 100), 255, dtype=np.uint8)
+            mock_thresh.return_value = (127.0, thresh_image)
+
+            def detect(image):
+                if image is thresh_image:
+                    return "otsu_data", None, None
+                return "", None, None
+
+            mock_detector.detectAndDecodeMulti.return_value = (False, [], None, None)
+            mock_detector.detectAndDecode.side_effect = detect
+
+            result = _decode_qr_code(mock_image)
+            assert result == "otsu_data"
+            mock_thresh.assert_called_once()
+            assert mock_thresh.call_args.args[3] == (
+                cv2.THRESH_BINARY + cv2.THRESH_OTSU
+            )
+
+    @pytest.mark.usefixtures("opencv_only")
+    def test_decode_qr_code_fallback_to_adaptive_threshold(self):
+        """Test fallback to the contrast-equalized adaptive threshold."""
+        mock_image = np.zeros((100, 100, 3), dtype=np.uint8)
+
+        with (
+            patch("qr_code_reader.qr_reader._get_detector") as mock_get_detector,
+            patch("cv2.adaptiveThreshold") as mock_thresh,
+        ):
+            mock_detector = mock_get_detector.return_value
+            thresh_image = np.full((100, 100), 255, dtype=np.uint8)
+            mock_thresh.return_value = thresh_image
+
+            def detect(image):
+                if image is thresh_image:
+                    return "thresh_data", None, None
+                return "", None, None
+
+            mock_detector.detectAndDecodeMulti.return_value = (False, [], None, None)
+            mock_detector.detectAndDecode.side_effect = detect
+
+            result = _decode_qr_code(mock_image)
+            assert result == "thresh_data"
+            mock_thresh.assert_called_once()
+
+    @pytest.mark.usefixtures("opencv_only")
+    def test_decode_qr_code_fallback_passes_run_in_parallel(self):
+        """Test that fallback passes run on the shared decode thread pool."""
+        mock_image = np.zeros((100, 100), dtype=np.uint8)
+        thread_names = []
+
+        def detect(image):
+            thread_names.append(threading.current_thread().name)
+            return "", None, None
+
+        with patch("qr_code_reader.qr_reader._get_detector") as mock_get_detector:
+            mock_detector = mock_get_detector.return_value
+            mock_detector.detectAndDecodeMulti.return_value = (False, [], None, None)
+            mock_detector.detectAndDecode.side_effect = detect
+
+            result = _decode_qr_code(mock_image)
+
+        assert result is None
+        assert len(thread_names) == 4
+        assert all(name.startswith("qr-decode") for name in thread_names)
+
+    @pytest.mark.usefixtures("opencv_only")
     def test_decode_qr_code_not_found(self):
         """Test when no QR code is found in any attempt."""
         mock_image = np.zeros((100, 100, 3), dtype=np.uint8)
 
         with (
-            patch("cv2.QRCodeDetector") as mock_detector_class,
+            patch("qr_code_reader.qr_reader._get_detector") as mock_get_detector,
             patch("cv2.cvtColor") as mock_cvt,
             patch("cv2.GaussianBlur") as mock_blur,
             patch("cv2.threshold") as mock_thresh,
+            patch("qr_code_reader.qr_reader._get_clahe") as mock_get_clahe,
+            patch("cv2.adaptiveThreshold") as mock_adaptive,
         ):
-            mock_detector = Mock()
-            mock_detector_class.return_value = mock_detector
-
+            mock_detector = mock_get_detector.return_value
             # Mock all detection attempts to fail
             mock_detector.detectAndDecodeMulti.return_value = (False, [], None, None)
-            mock_detector.detectAndDecode.return_value = (False, "", None)
+            mock_detector.detectAndDecode.return_value = ("", None, None)
 
             mock_cvt.return_value = mock_image
             mock_blur.return_value = mock_image
-            mock_thresh.return_value = (None, mock_image)
+            mock_thresh.return_value = (127.0, mock_image)
+            mock_get_clahe.return_value.apply.return_value = mock_image
+            mock_adaptive.return_value = mock_image
 
             result = _decode_qr_code(mock_image)
             assert result is None
 
+    def test_decode_qr_code_uses_fast_backend_first(self):
+        """Test that an installed fast backend short-circuits OpenCV."""
+        mock_image = np.zeros((100, 100, 3), dtype=np.uint8)
+        backend = Mock(return_value="fast_data")
+
+        with (
+            patch("qr_code_reader.qr_reader._FAST_BACKENDS", [backend]),
+            patch("qr_code_reader.qr_reader._get_detector") as mock_get_detector,
+        ):
+            mock_detector = mock_get_detector.return_value
+            result = _decode_qr_code(mock_image)
+
+            assert result == "fast_data"
+            (gray,) = backend.call_args[0]
+            assert gray.ndim == 2
+            mock_detector.detectAndDecodeMulti.assert_not_called()
+
+    def test_decode_qr_code_fast_backend_skips_preprocessing(self):
+        """Test that OpenCV only gets one pass when fast backends fail."""
+        mock_image = np.zeros((100, 100, 3), dtype=np.uint8)
+        backend = Mock(return_value=None)
+
+        with (
+            patch("qr_code_reader.qr_reader._FAST_BACKENDS", [backend]),
+            patch("qr_code_reader.qr_reader._get_detector") as mock_get_detector,
+        ):
+            mock_detector = mock_get_detector.return_value
+            mock_detector.detectAndDecodeMulti.return_value = (False, [], None, None)
+
+            result = _decode_qr_code(mock_image)
+
+            assert result is None
+            backend.assert_called_once()
+            mock_detector.detectAndDecodeMulti.assert_called_once()
+            mock_detector.detectAndDecode.assert_not_called()
+
+    def test_decode_zbar(self):
+        """Test decoding with the ZBar backend."""
+        gray = np.zeros((100, 100), dtype=np.uint8)
+
+        with patch("qr_code_reader.qr_reader._pyzbar") as mock_pyzbar:
+            mock_pyzbar.decode.return_value = [
+                SimpleNamespace(data=b""),
+                SimpleNamespace(data="https://example.com/é".encode()),
+            ]
+
+            assert _decode_zbar(gray) == "https://example.com/é"
+            mock_pyzbar.decode.assert_called_once_with(
+                gray, symbols=[mock_pyzbar.ZBarSymbol.QRCODE]
+            )
+
+    def test_detector_cached_per_thread(self):
+        """Test that detector objects are reused within a thread only."""
+        assert _get_detector() is _get_detector()
+        assert _get_clahe() is _get_clahe()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_detector = executor.submit(_get_detector).result()
+
+        assert other_detector is not _get_detector()
+
+    def test_scratch_buffer_reused_per_shape(self):
+        """Test that scratch buffers are reused for the same shape and name."""
+        buffer = _scratch_buffer((40, 50), "blurred")
+
+        assert buffer.shape == (40, 50)
+        assert buffer.dtype == np.uint8
+        assert _scratch_buffer((40, 50), "blurred") is buffer
+        assert _scratch_buffer((40, 50), "thresh") is not buffer
+        assert _scratch_buffer((50, 40), "blurred") is not buffer
+
+    def test_scratch_buffer_shape_limit(self):
+        """Test that scratch buffers for old shapes are dropped at the limit."""
+        buffer = _scratch_buffer((1, 1), "blurred")
+
+        with patch("qr_code_reader.qr_reader._MAX_SCRATCH_SHAPES", 2):
+            for size in range(2, 5):
+                _scratch_buffer((size, size), "blurred")
+
+        assert _scratch_buffer((1, 1), "blurred") is not buffer
+
+    def test_scratch_buffer_large_shape_not_cached(self):
+        """Test that buffers above the detection size are allocated per call."""
+        shape = (2000, 1000)
+        buffer = _scratch_buffer(shape, "blurred")
+
+        assert buffer.shape == shape
+        assert _scratch_buffer(shape, "blurred") is not buffer
+
     @patch("qr_code_reader.qr_reader.Path")
     @patch("qr_code_reader.qr_reader.Image")
     def test_validate_image_safety_success(self, mock_image_class, mock_path_class):
@@ -148,12 +613,12 @@ class TestQRCodeReader:
 
         # Mock PIL Image
         mock_img = Mock()
-        mock_img.width = 1920
-        mock_img.height = 1080
+        mock_img.size = (1920, 1080)
         mock_image_class.open.return_value.__enter__.return_value = mock_img
 
         result = validate_image_safety("/fake/path.jpg")
         assert result is True
+        mock_path.stat.assert_called_once()
 
     @patch("qr_code_reader.qr_reader.Path")
     def test_validate_image_safety_too_large(self, mock_path_class):
@@ -164,6 +629,7 @@ class TestQRCodeReader:
 
         result = validate_image_safety("/fake/path.jpg")
         assert result is False
+        mock_path.stat.assert_called_once()
 
     @patch("qr_code_reader.qr_reader.Path")
     @patch("qr_code_reader.qr_reader.Image")
@@ -176,8 +642,7 @@ class TestQRCodeReader:
         mock_path_class.return_value = mock_path
 
         mock_img = Mock()
-        mock_img.width = 15000
-        mock_img.height = 15000
+        mock_img.size = (15000, 15000)
         mock_image_class.open.return_value.__enter__.return_value = mock_img
 
         result = validate_image_safety("/fake/path.jpg")
@@ -1,120 +1,171 @@
 """Tests for MCP server functionality."""
 
-from unittest.mock import patch
+import re
+import sys
+from types import ModuleType
+from unittest.mock import AsyncMock, patch
 
-import mcp.types as types
+import mcp.server.stdio
 import pytest
+from mcp.types import TextContent
 
-from qr_code_reader.server import handle_call_tool, handle_list_tools
+from qr_code_reader import server as server_module
+from qr_code_reader.server import handle_call_tool, main, server
+
+
+class _UnavailableModule(ModuleType):
+    """Module stand-in whose attribute lookups fail like a missing import."""
+
+    def __getattr__(self, name):
+        raise ImportError(f"cannot import name {name!r}")
+
+
+# Built once and swapped into sys.modules by tests that need a failing import
+_unavailable_qr_reader = _UnavailableModule("qr_code_reader.qr_reader")
+
+_UNKNOWN_TOOL_RE = re.compile(r"Unknown tool: unknown_tool")
+
+# Tool arguments shared across parametrized and standalone call-tool tests
+_ARGS_PATH = {"image_path": "/fake/path.jpg"}
+_ARGS_DATA = {"image_data": "base64_data"}
+_ARGS_BOTH = {"image_path": "/fake/path.jpg", "image_data": "base64_data"}
+_ARGS_NONE: dict[str, str] = {}
 
 
 class TestMCPServer:
     """Test suite for MCP server."""
 
-    @pytest.mark.asyncio
-    async def test_handle_list_tools(self):
+    async def test_handle_list_tools(self, tool_list):
         """Test that list_tools returns the expected tool definition."""
-        tools = await handle_list_tools()
-
-        assert len(tools) == 1
-        tool = tools[0]
+        assert len(tool_list) == 1
+        tool = tool_list[0]
 
         assert tool.name == "qr_code_read"
         assert "Read and decode QR codes from images" in tool.description
         assert "inputSchema" in tool.__dict__
 
-        # Check schema structure
-        schema = tool.inputSchema
-        assert schema["type"] == "object"
-        assert "image_path" in schema["properties"]
-        assert "image_data" in schema["properties"]
-        assert "oneOf" in schema
+    def test_tool_input_schema(self, tool_schema):
+        """Test the structure of the qr_code_read input schema."""
+        assert tool_schema["type"] == "object"
+        assert "image_path" in tool_schema["properties"]
+        assert "image_data" in tool_schema["properties"]
+        assert "oneOf" in tool_schema
 
-    @pytest.mark.asyncio
     async def test_handle_call_tool_unknown_tool(self):
         """Test that unknown tool raises ValueError."""
-        with pytest.raises(ValueError, match="Unknown tool: unknown_tool"):
-            await handle_call_tool("unknown_tool", {})
-
-    @pytest.mark.asyncio
-    @patch("qr_code_reader.qr_reader.read_qr_code")
-    async def test_handle_call_tool_qr_code_read_success(self, mock_read_qr):
-        """Test successful QR code reading through MCP tool."""
-        mock_read_qr.return_value = "https://example.com"
-
-        result = await handle_call_tool(
-            "qr_code_read", {"image_path": "/fake/path.jpg"}
-        )
+        with pytest.raises(ValueError, match=_UNKNOWN_TOOL_RE):
+            await handle_call_tool("unknown_tool", _ARGS_NONE)
+
+    @pytest.mark.parametrize(
+        ("arguments", "return_value", "side_effect", "expected"),
+        [
+            pytest.param(
+                _ARGS_PATH,
+                "https://example.com",
+                None,
+                "QR Code decoded successfully: https://example.com",
+                id="image_path",
+            ),
+            pytest.param(
+                _ARGS_DATA,
+                "test_data",
+                None,
+                "QR Code decoded successfully: test_data",
+                id="image_data",
+            ),
+            pytest.param(
+                _ARGS_PATH,
+                None,
+                None,
+                "Error reading QR code: No QR code found in the image",
+                id="not_found",
+            ),
+            pytest.param(
+                _ARGS_NONE,
+                None,
+                None,
+                "Error: Provide exactly one of image_path or image_data",
+                id="no_arguments",
+            ),
+            pytest.param(
+                _ARGS_BOTH,
+                None,
+                None,
+                "Error: Provide exactly one of image_path or image_data",
+                id="both_arguments",
+            ),
+            pytest.param(
+                _ARGS_PATH,
+                None,
+                Exception("Something went wrong"),
+                "Error reading QR code: Something went wrong",
+                id="general_exception",
+            ),
+        ],
+    )
+    async def test_handle_call_tool_qr_code_read(
+        self, arguments, return_value, side_effect, expected, mock_read_qr
+    ):
+        """Test QR code tool responses for each input and reader outcome."""
+        mock_read_qr.return_value = return_value
+        mock_read_qr.side_effect = side_effect
+
+        result = await handle_call_tool("qr_code_read", arguments)
 
         assert len(result) == 1
-        assert isinstance(result[0], types.TextContent)
-        assert "QR Code decoded successfully: https://example.com" in result[0].text
-
-        mock_read_qr.assert_called_once_with(
-            image_path="/fake/path.jpg", image_data=None
-        )
-
-    @pytest.mark.asyncio
-    @patch("qr_code_reader.qr_reader.read_qr_code")
-    async def test_handle_call_tool_qr_code_read_with_base64(self, mock_read_qr):
-        """Test QR code reading with base64 data."""
-        mock_read_qr.return_value = "test_data"
+        assert type(result[0]) is TextContent
+        assert expected in result[0].text
 
-        result = await handle_call_tool("qr_code_read", {"image_data": "base64_data"})
-
-        assert len(result) == 1
-        assert isinstance(result[0], types.TextContent)
-        assert "QR Code decoded successfully: test_data" in result[0].text
+        if len(arguments) == 1:
+            mock_read_qr.assert_called_once_with(
+                image_path=arguments.get("image_path"),
+                image_data=arguments.get("image_data"),
+            )
+        else:
+            mock_read_qr.assert_not_called()
 
-        mock_read_qr.assert_called_once_with(image_path=None, image_data="base64_data")
+    async def test_handle_call_tool_import_error(self, monkeypatch):
+        """Test handling of ImportError when qr_reader module is not available."""
+        # Make the import statement in the server module fail
+        monkeypatch.setitem(
+            sys.modules, "qr_code_reader.qr_reader", _unavailable_qr_reader
+        )
 
-    @pytest.mark.asyncio
-    async def test_handle_call_tool_no_arguments(self):
-        """Test QR code tool with no arguments."""
-        result = await handle_call_tool("qr_code_read", {})
+        result = await handle_call_tool("qr_code_read", _ARGS_PATH)
 
         assert len(result) == 1
-        assert isinstance(result[0], types.TextContent)
-        assert (
-            "Error: Either image_path or image_data must be provided" in result[0].text
-        )
+        assert type(result[0]) is TextContent
+        assert "Error: QR code reader module not yet implemented" in result[0].text
 
-    @pytest.mark.asyncio
-    async def test_handle_call_tool_import_error(self):
-        """Test handling of ImportError when qr_reader module is not available."""
-        # Patch the import statement in the server module
-        with patch.dict("sys.modules", {"qr_code_reader.qr_reader": None}):
-            result = await handle_call_tool(
-                "qr_code_read", {"image_path": "/fake/path.jpg"}
-            )
+    async def test_handle_call_tool_logs_error(self, mock_read_qr, logger_mock):
+        """Test that errors are properly logged."""
+        mock_read_qr.side_effect = Exception("Test error")
 
-            assert len(result) == 1
-            assert isinstance(result[0], types.TextContent)
-            assert "Error: QR code reader module not yet implemented" in result[0].text
+        await handle_call_tool("qr_code_read", _ARGS_PATH)
 
-    @pytest.mark.asyncio
-    @patch("qr_code_reader.qr_reader.read_qr_code")
-    async def test_handle_call_tool_general_exception(self, mock_read_qr):
-        """Test handling of general exceptions during QR code reading."""
-        mock_read_qr.side_effect = Exception("Something went wrong")
+        logger_mock.error.assert_called_once()
+        args = logger_mock.error.call_args[0]
+        assert "Error reading QR code: Test error" in args[0] % args[1:]
 
-        result = await handle_call_tool(
-            "qr_code_read", {"image_path": "/fake/path.jpg"}
-        )
+    async def test_handle_call_tool_through_worker_queue(self, mock_read_qr):
+        """Test that reads go through the worker queue while the server runs."""
+        mock_read_qr.side_effect = ["https://example.com", Exception("Queued error")]
+        results = []
 
-        assert len(result) == 1
-        assert isinstance(result[0], types.TextContent)
-        assert "Error reading QR code: Something went wrong" in result[0].text
+        async def mock_run(*args, **kwargs):
+            assert server_module._read_queue is not None
+            for _ in range(2):
+                results.append(await handle_call_tool("qr_code_read", _ARGS_PATH))
 
-    @pytest.mark.asyncio
-    @patch("qr_code_reader.server.logger")
-    @patch("qr_code_reader.qr_reader.read_qr_code")
-    async def test_handle_call_tool_logs_error(self, mock_read_qr, mock_logger):
-        """Test that errors are properly logged."""
-        mock_read_qr.side_effect = Exception("Test error")
+        mock_stdio = AsyncMock()
+        mock_stdio.__aenter__.return_value = (AsyncMock(), AsyncMock())
 
-        await handle_call_tool("qr_code_read", {"image_path": "/fake/path.jpg"})
+        with (
+            patch.object(mcp.server.stdio, "stdio_server", return_value=mock_stdio),
+            patch.object(server, "run", side_effect=mock_run),
+        ):
+            await main()
 
-        mock_logger.error.assert_called_once()
-        args = mock_logger.error.call_args[0]
-        assert "Error reading QR code: Test error" in args[0]
+        assert "QR Code decoded successfully: https://example.com" in results[0][0].text
+        assert "Error reading QR code: Queued error" in results[1][0].text
+        assert server_module._read_queue is None